@@ -188,6 +188,7 @@ app.get('/api/info', (req, res): void => {
     endpoints: {
       auth: '/api/auth/*',
       transactions: '/api/transactions/*',
+      transactions_bulk: 'POST /api/transactions/bulk',
       categories: '/api/categories/*',
       budget_settings: '/api/transactions/budget-settings/:month/:year'
     }
@@ -330,6 +331,7 @@ app.use((req, res): void => {
         'POST /api/categories - Créer une catégorie',
         'GET /api/transactions/:month/:year - Transactions du mois',
         'POST /api/transactions - Ajouter une transaction',
+        'POST /api/transactions/bulk - Ajouter plusieurs transactions (max 500)',
         'PUT /api/transactions/:id - Modifier une transaction',
         'DELETE /api/transactions/:id - Supprimer une transaction',
         'GET /api/transactions/summary/:month/:year - Résumé mensuel',
@@ -392,6 +394,7 @@ const server = app.listen(PORT, (): void => {
   console.log('   💰 Transactions avec budget:');
   console.log('      GET  /api/transactions/:month/:year');
   console.log('      POST /api/transactions');
+  console.log('      POST /api/transactions/bulk');
   console.log('      PUT  /api/transactions/:id');
   console.log('      DELETE /api/transactions/:id');
   console.log('      GET  /api/transactions/summary/:month/:year');
@@ -346,6 +346,150 @@ router.post('/', (req: AuthRequest, res): void => {
   );
 });
 
+// Ajouter plusieurs transactions en une seule requête (imports, jeux de données de test)
+const MAX_BULK_TRANSACTIONS = 500;
+
+router.post('/bulk', (req: AuthRequest, res): void => {
+  console.log('📦 POST transactions en masse appelé');
+  const { transactions } = req.body;
+  const userId = req.user!.id;
+
+  if (!Array.isArray(transactions) || transactions.length === 0) {
+    res.status(400).json({ error: 'Le champ transactions doit être un tableau non vide' });
+    return;
+  }
+
+  if (transactions.length > MAX_BULK_TRANSACTIONS) {
+    res.status(400).json({ error: `Maximum ${MAX_BULK_TRANSACTIONS} transactions par requête` });
+    return;
+  }
+
+  const now = new Date();
+  const twoYearsAgo = new Date(now.getFullYear() - 2, now.getMonth(), now.getDate());
+  const oneYearFromNow = new Date(now.getFullYear() + 1, now.getMonth(), now.getDate());
+
+  // Validation de chaque transaction avant toute écriture
+  const rows: {
+    category_id: number;
+    amount: number;
+    description: string;
+    transaction_date: string;
+    month: number;
+    year: number;
+  }[] = [];
+
+  for (let index = 0; index < transactions.length; index++) {
+    const transaction = transactions[index] || {};
+
+    const requiredErrors = validateRequired(transaction, ['amount', 'category_id', 'transaction_date']);
+    if (requiredErrors.length > 0) {
+      res.status(400).json({ 
+        error: `Champs requis manquants (transaction ${index})`,
+        validationErrors: requiredErrors
+      });
+      return;
+    }
+
+    const amountErrors = validateNumber(transaction.amount, 'amount', 0.01, 50000);
+    if (amountErrors.length > 0) {
+      res.status(400).json({
+        error: `Montant invalide (transaction ${index})`,
+        validationErrors: amountErrors
+      });
+      return;
+    }
+
+    const transactionDate = new Date(transaction.transaction_date);
+    if (isNaN(transactionDate.getTime()) || transactionDate < twoYearsAgo || transactionDate > oneYearFromNow) {
+      res.status(400).json({ error: `Date de transaction invalide (transaction ${index})` });
+      return;
+    }
+
+    // Normaliser l'ID (3 et "3" désignent la même catégorie pour SQLite)
+    const categoryId = Number(transaction.category_id);
+    if (!Number.isInteger(categoryId)) {
+      res.status(400).json({ error: `Catégorie invalide (transaction ${index})` });
+      return;
+    }
+
+    rows.push({
+      category_id: categoryId,
+      amount: Number(transaction.amount),
+      description: transaction.description || '',
+      transaction_date: transactionDate.toISOString().split('T')[0],
+      month: transactionDate.getMonth() + 1,
+      year: transactionDate.getFullYear()
+    });
+  }
+
+  // Vérifier en une requête que toutes les catégories appartiennent à l'utilisateur
+  const categoryIds = [...new Set(rows.map(row => row.category_id))];
+  const placeholders = categoryIds.map(() => '?').join(', ');
+
+  db.all(
+    `SELECT id FROM categories WHERE user_id = ? AND id IN (${placeholders})`,
+    [userId, ...categoryIds],
+    (err, categories: any[]): void => {
+      if (err) {
+        console.error('❌ Erreur vérification catégories:', err);
+        res.status(500).json({ error: 'Erreur serveur' });
+        return;
+      }
+
+      if (categories.length !== categoryIds.length) {
+        res.status(404).json({ error: 'Catégorie non trouvée ou non autorisée' });
+        return;
+      }
+
+      // Mois concernés, pour créer les budgets par défaut manquants
+      const months = [...new Map(rows.map((row): [string, number[]] => [`${row.year}-${row.month}`, [row.month, row.year]])).values()];
+
+      db.run(
+        `INSERT OR IGNORE INTO user_budget_settings (user_id, month, year, monthly_salary, savings_goal)
+         SELECT ?, json_extract(value, '$[0]'), json_extract(value, '$[1]'), 2750, 800 FROM json_each(?)`,
+        [userId, JSON.stringify(months)],
+        (err): void => {
+          if (err) {
+            console.error('❌ Erreur création budgets:', err);
+            res.status(500).json({ error: 'Erreur serveur' });
+            return;
+          }
+
+          // Une seule instruction INSERT ... SELECT : atomique sans transaction explicite sur la connexion partagée
+          const payload = rows.map(({ category_id, amount, description, transaction_date }) => (
+            { category_id, amount, description, transaction_date }
+          ));
+
+          db.run(
+            `INSERT INTO transactions (user_id, category_id, amount, description, transaction_date)
+             SELECT ?, json_extract(value, '$.category_id'), json_extract(value, '$.amount'),
+                    json_extract(value, '$.description'), json_extract(value, '$.transaction_date')
+             FROM json_each(?) ORDER BY key`,
+            [userId, JSON.stringify(payload)],
+            function (err): void {
+              if (err) {
+                console.error('❌ Erreur insertion transactions en masse:', err);
+                res.status(500).json({ error: 'Erreur lors de l\'ajout des transactions' });
+                return;
+              }
+
+              // Les IDs AUTOINCREMENT d'une même instruction sont consécutifs
+              const firstId = this.lastID - payload.length + 1;
+              const created = payload.map((row, index) => ({ id: firstId + index, ...row }));
+
+              console.log(`✅ ${created.length} transactions créées en masse`);
+              res.status(201).json({
+                message: `${created.length} transactions ajoutées avec succès`,
+                transactions: created
+              });
+            }
+          );
+        }
+      );
+    }
+  );
+});
+
 // Modifier une transaction
 router.put('/:id', (req: AuthRequest, res): void => {
   console.log('✏️ PUT transaction appelé');
@@ -5,62 +5,242 @@ Simule un parcours utilisateur complet avec création de transactions
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import random
+import hashlib
+import os
+import pathlib
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import time
 
+# En-têtes retirant l'authentification de session pour les appels anonymes
+NO_AUTH_HEADERS = {'Authorization': None}
+
+# Nombre maximum de requêtes simultanées lors des créations unitaires en parallèle
+BULK_CONCURRENCY = 20
+
+# Nombre maximum de transactions par appel à POST /api/transactions/bulk (limite serveur)
+BULK_BATCH_SIZE = 500
+
+# Nouvelles tentatives sur HTTP 429 (Too Many Requests) avant d'abandonner
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Attente maximale acceptée sur un 429 : au-delà (fenêtre du rate limiter), on abandonne la requête
+MAX_RETRY_AFTER = 5
+
+# Pause entre les POST une fois le serveur jugé saturé (trop de 429 consécutifs)
+SLOW_MODE_DELAY = 0.1
+
+# Codes entiers des fréquences des templates de transactions
+FREQ_MONTHLY, FREQ_BIWEEKLY, FREQ_WEEKLY, FREQ_FREQUENT, FREQ_OCCASIONAL, FREQ_RARE = range(6)
+FREQUENCY_CODES = {
+    "monthly": FREQ_MONTHLY,
+    "bi-weekly": FREQ_BIWEEKLY,
+    "weekly": FREQ_WEEKLY,
+    "frequent": FREQ_FREQUENT,
+    "occasional": FREQ_OCCASIONAL,
+    "rare": FREQ_RARE
+}
+
+# Graine des données générées : mêmes transactions d'une exécution à l'autre
+FIXTURE_SEED = 42
+
+# Détail affiché pour chaque test en échec
+ERROR_DETAILS = {
+    "Création d'utilisateur": "Impossible de créer l'utilisateur de test. Vérifiez l'endpoint /api/auth/register.",
+    "Connexion utilisateur": "Échec de connexion. Vérifiez que l'utilisateur existe et que les identifiants sont corrects.",
+    "Récupération catégories": "Impossible de récupérer les catégories. Vérifiez l'endpoint /api/categories.",
+    "Création transactions": "Échec de création des transactions. Vérifiez l'endpoint /api/transactions.",
+    "Récupération transactions mensuelles": "Impossible de récupérer les transactions mensuelles. Vérifiez l'endpoint /api/transactions/{month}/{year}.",
+    "Opérations sur transactions": "Impossible de modifier/supprimer les transactions. Vérifiez les endpoints PUT/DELETE.",
+    "Analyse budgétaire": "Échec de l'analyse budgétaire. Probablement lié à l'absence de transactions."
+}
+
+# Recommandations affichées si au moins un des tests associés échoue
+RECOMMENDATIONS = [
+    (("Création d'utilisateur",), [
+        "1. Vérifiez que l'endpoint POST /api/auth/register fonctionne",
+        "2. Vérifiez la structure des données attendues pour l'inscription"
+    ]),
+    (("Connexion utilisateur",), [
+        "1. Assurez-vous que l'utilisateur autobot@google.com existe dans la base",
+        "2. Vérifiez que le mot de passe est 'password123'",
+        "3. Vérifiez l'endpoint POST /api/auth/login",
+        "4. Vérifiez que la réponse contient un token JWT"
+    ]),
+    (("Récupération catégories", "Création transactions", "Récupération transactions mensuelles"), [
+        "1. Vérifiez que l'authentification JWT fonctionne correctement",
+        "2. Vérifiez que l'header 'Authorization: Bearer <token>' est accepté",
+        "3. Exécutez le script init.ts pour créer les catégories par défaut"
+    ])
+]
+
 class BudgetTrackerTester:
     def __init__(self, base_url: str = "http://localhost:3001"):
         self.base_url = base_url
         self.session = requests.Session()
+        
+        # Pool de connexions keep-alive réutilisé par tous les appels (y compris en parallèle)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            # Rejeu des seules requêtes idempotentes sans effet de bord (un DELETE rejoué renverrait 404) ;
+            # une fois les tentatives épuisées, la dernière réponse est rendue telle quelle à _handle
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+                # Les 429 et leur Retry-After sont gérés uniquement par _send (plafonné à MAX_RETRY_AFTER)
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers['Content-Type'] = 'application/json'
         self.user_data = {}
         self.categories = {}
         self.transactions = []
         self.auth_token = None
+        self._fixture_cache = pathlib.Path.home() / '.cache' / 'budget_tracker_fixtures'
+        self._rng = random.Random(FIXTURE_SEED)
+        self._monthly_cache = {}
+        self._consecutive_429 = 0
+        self._slow_mode = False
+        
+        # Horodatage des logs mis en cache à la seconde
+        self._last_ts = ''
+        self._last_ts_sec = 0
         
     def log(self, message: str, level: str = "INFO"):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts = time.strftime("%H:%M:%S", time.localtime(now))
+            self._last_ts_sec = now
+        print(f"[{self._last_ts}] {level}: {message}")
         
     def make_request(self, method: str, endpoint: str, data: Dict = None, expected_status: int = 200, include_auth: bool = True) -> Optional[Dict]:
-        """Effectue une requête HTTP avec gestion d'erreurs et authentification"""
+        """Effectue une requête HTTP avec gestion d'erreurs et authentification (préférer _get/_post/_put/_delete)"""
+        method = method.upper()
+        
+        if method == "GET":
+            return self._get(endpoint, expected_status, include_auth)
+        elif method == "POST":
+            return self._post(endpoint, data, expected_status, include_auth)
+        elif method == "PUT":
+            return self._put(endpoint, data, expected_status, include_auth)
+        elif method == "DELETE":
+            return self._delete(endpoint, expected_status, include_auth)
+        else:
+            raise ValueError(f"Méthode HTTP non supportée: {method}")
+    
+    def _get(self, endpoint: str, expected_status: int = 200, include_auth: bool = True) -> Optional[Dict]:
+        return self._send("GET", self.session.get, endpoint, expected_status, include_auth)
+    
+    def _post(self, endpoint: str, data: Dict = None, expected_status: int = 201, include_auth: bool = True) -> Optional[Dict]:
+        # Corps pré-encodé avec orjson (le Content-Type JSON est porté par la session)
+        body = orjson.dumps(data) if data is not None else None
+        return self._send("POST", self.session.post, endpoint, expected_status, include_auth, data=body)
+    
+    def _put(self, endpoint: str, data: Dict = None, expected_status: int = 200, include_auth: bool = True) -> Optional[Dict]:
+        body = orjson.dumps(data) if data is not None else None
+        return self._send("PUT", self.session.put, endpoint, expected_status, include_auth, data=body)
+    
+    def _delete(self, endpoint: str, expected_status: int = 200, include_auth: bool = True) -> Optional[Dict]:
+        return self._send("DELETE", self.session.delete, endpoint, expected_status, include_auth)
+    
+    def _send(self, method: str, send, endpoint: str, expected_status: int, include_auth: bool, **kwargs) -> Optional[Dict]:
+        """Envoie la requête avec la méthode de session fournie, en réessayant sur HTTP 429"""
         url = f"{self.base_url}{endpoint}"
-        headers = {'Content-Type': 'application/json'}
         
-        # Ajouter l'authentification si disponible et demandée
-        if include_auth and self.auth_token:
-            headers['Authorization'] = f'Bearer {self.auth_token}'
+        # L'authentification est portée par la session, on la masque si non demandée
+        headers = None if include_auth else NO_AUTH_HEADERS
         
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, headers=headers)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=data, headers=headers)
-            elif method.upper() == "PUT":
-                response = self.session.put(url, json=data, headers=headers)
-            elif method.upper() == "DELETE":
-                response = self.session.delete(url, headers=headers)
-            else:
-                raise ValueError(f"Méthode HTTP non supportée: {method}")
-            
-            self.log(f"{method} {endpoint} -> {response.status_code}")
-            
-            if response.status_code != expected_status:
-                self.log(f"Erreur: Code de statut attendu {expected_status}, reçu {response.status_code}", "ERROR")
-                self.log(f"Réponse: {response.text}", "ERROR")
-                return None
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                if self._slow_mode and method == "POST":
+                    time.sleep(SLOW_MODE_DELAY)
+                
+                response = send(url, headers=headers, **kwargs)
+                
+                if response.status_code != 429:
+                    self._consecutive_429 = 0
+                    break
                 
-            return response.json() if response.content else {}
+                # Serveur saturé : attendre le délai demandé (Retry-After) ou un backoff exponentiel
+                self._consecutive_429 += 1
+                if self._consecutive_429 > MAX_RATE_LIMIT_RETRIES:
+                    self._slow_mode = True
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    break
+                
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 2 ** attempt))
+                except ValueError:
+                    retry_after = 2 ** attempt
+                if retry_after > MAX_RETRY_AFTER:
+                    self.log(f"{method} {endpoint} -> 429, le serveur demande {retry_after}s d'attente (max {MAX_RETRY_AFTER}s), abandon", "ERROR")
+                    break
+                
+                self.log(f"{method} {endpoint} -> 429, nouvelle tentative dans {retry_after}s", "WARNING")
+                time.sleep(retry_after)
             
         except requests.RequestException as e:
             self.log(f"Erreur de requête: {e}", "ERROR")
             return None
-        except json.JSONDecodeError as e:
+        
+        return self._handle(response, method, endpoint, expected_status)
+    
+    def _handle(self, response, method: str, endpoint: str, expected_status: int) -> Optional[Dict]:
+        """Vérifie le code de statut et décode la réponse JSON"""
+        self.log(f"{method} {endpoint} -> {response.status_code}")
+        
+        if response.status_code != expected_status:
+            self.log(f"Erreur: Code de statut attendu {expected_status}, reçu {response.status_code}", "ERROR")
+            self.log(f"Réponse: {response.text}", "ERROR")
+            return None
+        
+        # Corps déjà lu par requests : un seul accès, décodé directement depuis les octets
+        content = response.content
+        if not content:
+            return {}
+        
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
             self.log(f"Erreur de décodage JSON: {e}", "ERROR")
             return None
 
+    def _bulk_post(self, endpoint: str, payloads: List[Dict], expected_status: int = 201) -> List[Optional[Dict]]:
+        """Envoie plusieurs POST en parallèle (concurrence bornée) et renvoie les réponses dans l'ordre"""
+        with ThreadPoolExecutor(max_workers=BULK_CONCURRENCY) as executor:
+            return list(executor.map(lambda payload: self._post(endpoint, payload, expected_status), payloads))
+
+    def _get_month(self, month: int, year: int) -> Optional[Dict]:
+        """Récupère les transactions d'un mois, en réutilisant la réponse tant qu'aucune écriture ne l'a invalidée"""
+        key = (month, year)
+        if key not in self._monthly_cache:
+            response = self._get(f"/api/transactions/{month}/{year}")
+            if not response:
+                return response
+            self._monthly_cache[key] = response
+        return self._monthly_cache[key]
+
+    def _invalidate_month(self, transaction_date: Optional[str] = None):
+        """Invalide le mois d'une transaction modifiée (ou tout le cache si la date est inconnue)"""
+        try:
+            year, month = transaction_date.split("-")[:2]
+            self._monthly_cache.pop((int(month), int(year)), None)
+        except (AttributeError, ValueError):
+            self._monthly_cache.clear()
+
     def test_create_user(self, email: str = "autobot@google.com", password: str = "password123", firstName: str = "autobob") -> bool:
         """Test de création d'utilisateur"""
         self.log("=== TEST CRÉATION D'UTILISATEUR ===")
@@ -71,7 +251,7 @@ class BudgetTrackerTester:
             "firstName": firstName
         }
         
-        response = self.make_request("POST", "/api/auth/register", user_data, 201, include_auth=False)
+        response = self._post("/api/auth/register", user_data, 201, include_auth=False)
         
         if response and "user" in response:
             self.log(f"Utilisateur créé avec succès: {response['user']['firstName']} ({response['user']['email']})")
@@ -97,11 +277,12 @@ class BudgetTrackerTester:
             "password": password
         }
         
-        response = self.make_request("POST", "/api/auth/login", login_data, include_auth=False)
+        response = self._post("/api/auth/login", login_data, 200, include_auth=False)
         
         if response and "user" in response and "token" in response:
             self.user_data = response["user"]
             self.auth_token = response["token"]
+            self.session.headers['Authorization'] = f'Bearer {self.auth_token}'
             self.log(f"Connexion réussie: {self.user_data['firstName']} ({self.user_data['email']})")
             self.log(f"Token JWT récupéré: {self.auth_token[:20]}...")
             return True
@@ -113,18 +294,18 @@ class BudgetTrackerTester:
         """Test de récupération des catégories"""
         self.log("=== TEST RÉCUPÉRATION DES CATÉGORIES ===")
         
-        response = self.make_request("GET", "/api/categories")
+        response = self._get("/api/categories")
         
         if response and "categories" in response:
-            self.categories = {cat["type"]: [] for cat in response["categories"]}
-            
+            # Catégories indexées par type puis par nom : {type: {nom: catégorie}}
+            self.categories = {}
             for category in response["categories"]:
-                self.categories[category["type"]].append(category)
+                self.categories.setdefault(category["type"], {})[category["name"]] = category
                 
             self.log(f"Catégories récupérées:")
             for cat_type, cats in self.categories.items():
                 self.log(f"  {cat_type}: {len(cats)} catégorie(s)")
-                for cat in cats:
+                for cat in cats.values():
                     self.log(f"    - {cat['name']} (budget: {cat['budget_amount']}€)")
             
             return True
@@ -133,9 +314,7 @@ class BudgetTrackerTester:
             return False
 
     def generate_realistic_transactions(self) -> List[Dict]:
-        """Génère des transactions réalistes pour les 3 derniers mois"""
-        transactions = []
-        
+        """Génère des transactions réalistes pour les 3 derniers mois (mises en cache sur disque)"""
         # Définir la période (3 derniers mois)
         end_date = datetime.now()
         start_date = end_date - timedelta(days=90)
@@ -203,65 +382,107 @@ class BudgetTrackerTester:
             }
         }
         
-        # Générer les transactions
-        current_date = start_date
-        while current_date <= end_date:
-            # Pour chaque type de catégorie
-            for cat_type, categories in transaction_templates.items():
-                if cat_type not in self.categories:
+        # La période glisse chaque jour et les IDs de catégories dépendent de la base : tous deux font partie de la clé,
+        # ainsi qu'une empreinte des templates pour ne pas resservir des données périmées après leur modification
+        category_ids = sorted(cat["id"] for cats in self.categories.values() for cat in cats.values())
+        templates_hash = hashlib.blake2b(json.dumps(transaction_templates, sort_keys=True).encode(), digest_size=8).hexdigest()
+        key = hashlib.blake2b(
+            f"{self.user_data.get('email', '')}|{end_date:%Y-%m-%d}|{FIXTURE_SEED}|{category_ids}|{templates_hash}".encode(),
+            digest_size=8
+        ).hexdigest()
+        cache_path = self._fixture_cache / f"{key}.json"
+        
+        if cache_path.exists():
+            try:
+                transactions = json.loads(cache_path.read_bytes())
+                self.log(f"Chargé {len(transactions)} transactions depuis le cache ({cache_path})")
+                return transactions
+            except (OSError, ValueError):
+                # Fichier illisible, tronqué ou corrompu : le supprimer si possible et régénérer
+                self.log(f"Cache de transactions illisible, régénération ({cache_path})", "WARNING")
+                try:
+                    cache_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+        
+        # Générateur dédié et méthodes liées en variables locales pour la boucle de génération
+        rng = random.Random(FIXTURE_SEED)
+        _rand = rng.random
+        _randint = rng.randint
+        
+        # Précalculer une seule fois les jours de la période (jour du mois, jour de semaine, date formatée)
+        days = [
+            (day.day, day.weekday(), day.strftime("%Y-%m-%d"))
+            for day in (start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1))
+        ]
+        # Transactions regroupées par jour : évite un tri final sur les dates formatées
+        transactions_by_day = [[] for _ in days]
+        
+        # Aplatir une seule fois les templates en tâches (catégorie résolue, code de fréquence, bornes du montant)
+        jobs = []
+        for cat_type, templates_by_name in transaction_templates.items():
+            if cat_type not in self.categories:
+                continue
+            
+            cats_by_name = self.categories[cat_type]
+            for cat_name, templates in templates_by_name.items():
+                if cat_name not in cats_by_name:
                     continue
-                    
-                # Pour chaque catégorie disponible
-                for category in self.categories[cat_type]:
-                    cat_name = category["name"]
-                    
-                    if cat_name not in categories:
+                
+                cat_id = cats_by_name[cat_name]["id"]
+                for template in templates:
+                    frequency = FREQUENCY_CODES.get(template["frequency"])
+                    if frequency is None:
                         continue
-                        
-                    for template in categories[cat_name]:
-                        should_create = False
-                        
-                        # Déterminer si on doit créer une transaction selon la fréquence
-                        if template["frequency"] == "monthly":
-                            should_create = current_date.day == 1 or (current_date.day <= 5 and random.random() < 0.3)
-                        elif template["frequency"] == "bi-weekly":
-                            should_create = current_date.day in [1, 15] or random.random() < 0.1
-                        elif template["frequency"] == "weekly":
-                            should_create = current_date.weekday() in [5, 6] and random.random() < 0.4
-                        elif template["frequency"] == "frequent":
-                            should_create = random.random() < 0.2
-                        elif template["frequency"] == "occasional":
-                            should_create = random.random() < 0.1
-                        elif template["frequency"] == "rare":
-                            should_create = random.random() < 0.05
-                        
-                        if should_create:
-                            amount = random.randint(
-                                int(template["amount_range"][0]),
-                                int(template["amount_range"][1])
-                            )
-                            
-                            # Ajuster la date légèrement pour plus de réalisme
-                            transaction_date = current_date + timedelta(
-                                hours=random.randint(8, 20),
-                                minutes=random.randint(0, 59)
-                            )
-                            
-                            transactions.append({
-                                "category_id": category["id"],
-                                "amount": amount,
-                                "description": template["description"],
-                                "transaction_date": transaction_date.strftime("%Y-%m-%d"),
-                                "category_name": cat_name,
-                                "category_type": cat_type
-                            })
-            
-            current_date += timedelta(days=1)
+                    
+                    low, high = template["amount_range"]
+                    jobs.append((cat_id, cat_name, cat_type, template["description"], int(low), int(high), frequency))
         
-        # Trier par date
-        transactions.sort(key=lambda x: x["transaction_date"])
+        # Générer les transactions
+        for cat_id, cat_name, cat_type, description, low, high, frequency in jobs:
+            # Sélectionner d'un coup les jours où la transaction a lieu selon la fréquence
+            if frequency == FREQ_MONTHLY:
+                selected = [i for i, (day, _, _) in enumerate(days) if day == 1 or (day <= 5 and _rand() < 0.3)]
+            elif frequency == FREQ_BIWEEKLY:
+                selected = [i for i, (day, _, _) in enumerate(days) if day in (1, 15) or _rand() < 0.1]
+            elif frequency == FREQ_WEEKLY:
+                selected = [i for i, (_, weekday, _) in enumerate(days) if weekday >= 5 and _rand() < 0.4]
+            elif frequency == FREQ_FREQUENT:
+                selected = [i for i in range(len(days)) if _rand() < 0.2]
+            elif frequency == FREQ_OCCASIONAL:
+                selected = [i for i in range(len(days)) if _rand() < 0.1]
+            else:  # FREQ_RARE
+                selected = [i for i in range(len(days)) if _rand() < 0.05]
+            
+            for i in selected:
+                transactions_by_day[i].append({
+                    "category_id": cat_id,
+                    "amount": _randint(low, high),
+                    "description": description,
+                    "transaction_date": days[i][2],
+                    "category_name": cat_name,
+                    "category_type": cat_type
+                })
+        
+        # Aplatir par ordre chronologique
+        transactions = [transaction for day_transactions in transactions_by_day for transaction in day_transactions]
         
         self.log(f"Généré {len(transactions)} transactions sur 3 mois")
+        
+        # Écriture atomique : un fichier temporaire remplace le cache, jamais de fichier tronqué
+        # Le cache est facultatif : un HOME en lecture seule ou un disque plein ne doit pas faire échouer le test
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self._fixture_cache.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(json.dumps(transactions).encode())
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            self.log(f"Impossible d'écrire le cache de transactions ({cache_path}): {e}", "WARNING")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+        
         return transactions
 
     def test_create_transactions(self) -> bool:
@@ -273,28 +494,41 @@ class BudgetTrackerTester:
         success_count = 0
         total_count = len(transactions_to_create)
         
-        for i, transaction in enumerate(transactions_to_create):
-            # Données à envoyer à l'API
-            api_data = {
+        # Données à envoyer à l'API
+        api_data_list = [
+            {
                 "category_id": transaction["category_id"],
                 "amount": transaction["amount"],
                 "description": transaction["description"],
                 "transaction_date": transaction["transaction_date"]
             }
+            for transaction in transactions_to_create
+        ]
+        
+        for start in range(0, total_count, BULK_BATCH_SIZE):
+            batch = api_data_list[start:start + BULK_BATCH_SIZE]
+            response = self._post("/api/transactions/bulk", {"transactions": batch})
             
-            response = self.make_request("POST", "/api/transactions", api_data, 201)
+            if response and "transactions" in response:
+                created = response["transactions"]
+                success_count += len(created)
+                self.transactions.extend(created)
+                self.log(f"Lot créé ({start + len(created)}/{total_count}): {len(created)} transaction(s)")
+                continue
             
-            if response:
-                success_count += 1
-                self.log(f"Transaction créée ({i+1}/{total_count}): {transaction['description']} - {transaction['amount']}€")
-                self.transactions.append(response)
-            else:
-                self.log(f"Échec création transaction ({i+1}/{total_count}): {transaction['description']}", "ERROR")
+            # Endpoint groupé indisponible : repli sur des créations unitaires en parallèle
+            self.log("Création groupée impossible, repli sur les créations unitaires", "ERROR")
+            responses = self._bulk_post("/api/transactions", batch)
             
-            # Petite pause pour éviter de surcharger le serveur
-            if i % 10 == 0:
-                time.sleep(0.5)
-        
+            for i, (transaction, response) in enumerate(zip(batch, responses), start):
+                if response:
+                    success_count += 1
+                    self.log(f"Transaction créée ({i+1}/{total_count}): {transaction['description']} - {transaction['amount']}€")
+                    self.transactions.append(response)
+                else:
+                    self.log(f"Échec création transaction ({i+1}/{total_count}): {transaction['description']}", "ERROR")
+        
+        self._monthly_cache.clear()
         self.log(f"Transactions créées: {success_count}/{total_count}")
         return success_count > 0
 
@@ -312,15 +546,17 @@ class BudgetTrackerTester:
         
         success = True
         
-        for month, year in months_to_test:
-            response = self.make_request("GET", f"/api/transactions/{month}/{year}")
-            
+        # Les trois mois sont indépendants : requêtes en parallèle sur le pool keep-alive de la session
+        with ThreadPoolExecutor(max_workers=len(months_to_test)) as executor:
+            responses = list(executor.map(lambda month_year: self._get_month(*month_year), months_to_test))
+        
+        for (month, year), response in zip(months_to_test, responses):
             if response and "transactions" in response:
                 transactions = response["transactions"]
                 self.log(f"Mois {month}/{year}: {len(transactions)} transaction(s)")
                 
                 # Afficher un résumé par catégorie
-                category_summary = {}
+                category_summary = defaultdict(lambda: {"count": 0, "total": 0, "type": "unknown"})
                 total_amount = 0
                 
                 for transaction in transactions:
@@ -328,11 +564,10 @@ class BudgetTrackerTester:
                     cat_type = transaction.get("category_type", "unknown")
                     amount = transaction.get("amount", 0)
                     
-                    if cat_name not in category_summary:
-                        category_summary[cat_name] = {"count": 0, "total": 0, "type": cat_type}
-                    
-                    category_summary[cat_name]["count"] += 1
-                    category_summary[cat_name]["total"] += amount
+                    summary = category_summary[cat_name]
+                    summary["count"] += 1
+                    summary["total"] += amount
+                    summary["type"] = cat_type
                     total_amount += amount if cat_type != "income" else -amount
                 
                 self.log(f"  Résumé par catégorie:")
@@ -356,7 +591,7 @@ class BudgetTrackerTester:
             return False
         
         # Prendre une transaction au hasard
-        transaction = random.choice(self.transactions)
+        transaction = self._rng.choice(self.transactions)
         transaction_id = transaction.get("id")
         
         if not transaction_id:
@@ -371,7 +606,10 @@ class BudgetTrackerTester:
             "transaction_date": transaction.get("transaction_date")
         }
         
-        response = self.make_request("PUT", f"/api/transactions/{transaction_id}", modified_data)
+        # Les écritures qui suivent rendent obsolète le mois de la transaction
+        self._invalidate_month(transaction.get("transaction_date"))
+        
+        response = self._put(f"/api/transactions/{transaction_id}", modified_data)
         
         if response:
             self.log(f"Transaction {transaction_id} modifiée avec succès")
@@ -380,7 +618,7 @@ class BudgetTrackerTester:
             return False
         
         # Test de suppression
-        response = self.make_request("DELETE", f"/api/transactions/{transaction_id}", expected_status=204)
+        response = self._delete(f"/api/transactions/{transaction_id}", expected_status=204)
         
         if response is not None:  # 204 peut retourner None
             self.log(f"Transaction {transaction_id} supprimée avec succès")
@@ -393,33 +631,28 @@ class BudgetTrackerTester:
         """Test d'analyse budgétaire"""
         self.log("=== TEST ANALYSE BUDGÉTAIRE ===")
         
-        # Calculer les statistiques à partir des données récupérées
+        # Calculer les statistiques à partir des données récupérées (réponse partagée avec le test mensuel)
         now = datetime.now()
         
-        response = self.make_request("GET", f"/api/transactions/{now.month}/{now.year}")
+        response = self._get_month(now.month, now.year)
         
         if not response or "transactions" not in response:
             self.log("Impossible de récupérer les données pour l'analyse", "ERROR")
             return False
         
-        transactions = response["transactions"]
-        
-        # Analyser par type de catégorie
+        # Analyser par type de catégorie (seuls le type et le montant sont utiles)
         analysis = {
-            "income": {"total": 0, "count": 0, "transactions": []},
-            "fixed_expense": {"total": 0, "count": 0, "transactions": []},
-            "variable_expense": {"total": 0, "count": 0, "transactions": []},
-            "savings": {"total": 0, "count": 0, "transactions": []}
+            "income": {"total": 0, "count": 0},
+            "fixed_expense": {"total": 0, "count": 0},
+            "variable_expense": {"total": 0, "count": 0},
+            "savings": {"total": 0, "count": 0}
         }
         
-        for transaction in transactions:
-            cat_type = transaction.get("category_type", "unknown")
-            amount = transaction.get("amount", 0)
-            
-            if cat_type in analysis:
-                analysis[cat_type]["total"] += amount
-                analysis[cat_type]["count"] += 1
-                analysis[cat_type]["transactions"].append(transaction)
+        for transaction in response["transactions"]:
+            bucket = analysis.get(transaction.get("category_type", "unknown"))
+            if bucket is not None:
+                bucket["total"] += transaction.get("amount", 0)
+                bucket["count"] += 1
         
         # Afficher l'analyse
         self.log("Analyse budgétaire du mois courant:")
@@ -475,26 +708,13 @@ class BudgetTrackerTester:
                     failed_tests.append(test_name)
                     
                     # Ajouter des détails spécifiques selon le type d'échec
-                    if test_name == "Création d'utilisateur":
-                        error_details[test_name] = "Impossible de créer l'utilisateur de test. Vérifiez l'endpoint /api/auth/register."
-                    elif test_name == "Connexion utilisateur":
-                        error_details[test_name] = "Échec de connexion. Vérifiez que l'utilisateur existe et que les identifiants sont corrects."
-                    elif test_name == "Récupération catégories":
-                        if not hasattr(self, 'auth_token') or not self.auth_token:
-                            error_details[test_name] = "Pas de token d'authentification. La connexion a probablement échoué."
-                        else:
-                            error_details[test_name] = "Impossible de récupérer les catégories. Vérifiez l'endpoint /api/categories."
-                    elif test_name == "Création transactions":
-                        if not self.categories:
-                            error_details[test_name] = "Aucune catégorie disponible pour créer des transactions."
-                        else:
-                            error_details[test_name] = "Échec de création des transactions. Vérifiez l'endpoint /api/transactions."
-                    elif test_name == "Récupération transactions mensuelles":
-                        error_details[test_name] = "Impossible de récupérer les transactions mensuelles. Vérifiez l'endpoint /api/transactions/{month}/{year}."
-                    elif test_name == "Opérations sur transactions":
-                        error_details[test_name] = "Impossible de modifier/supprimer les transactions. Vérifiez les endpoints PUT/DELETE."
-                    elif test_name == "Analyse budgétaire":
-                        error_details[test_name] = "Échec de l'analyse budgétaire. Probablement lié à l'absence de transactions."
+                    error_details[test_name] = ERROR_DETAILS.get(test_name, f"Test inconnu: {test_name}")
+                    
+                    # Causes plus probables selon l'état du testeur
+                    if test_name == "Récupération catégories" and not self.auth_token:
+                        error_details[test_name] = "Pas de token d'authentification. La connexion a probablement échoué."
+                    elif test_name == "Création transactions" and not self.categories:
+                        error_details[test_name] = "Aucune catégorie disponible pour créer des transactions."
                     
                     # Arrêter les tests si la connexion échoue (les autres tests dépendent de l'auth)
                     if test_name == "Connexion utilisateur":
@@ -542,20 +762,10 @@ class BudgetTrackerTester:
         if failed_tests:
             self.log(f"\n🔧 RECOMMANDATIONS POUR CORRIGER LES ÉCHECS:")
             
-            if "Création d'utilisateur" in failed_tests:
-                self.log("   1. Vérifiez que l'endpoint POST /api/auth/register fonctionne")
-                self.log("   2. Vérifiez la structure des données attendues pour l'inscription")
-            
-            if "Connexion utilisateur" in failed_tests:
-                self.log("   1. Assurez-vous que l'utilisateur autobot@google.com existe dans la base")
-                self.log("   2. Vérifiez que le mot de passe est 'password123'")
-                self.log("   3. Vérifiez l'endpoint POST /api/auth/login")
-                self.log("   4. Vérifiez que la réponse contient un token JWT")
-            
-            if any(test in failed_tests for test in ["Récupération catégories", "Création transactions", "Récupération transactions mensuelles"]):
-                self.log("   1. Vérifiez que l'authentification JWT fonctionne correctement")
-                self.log("   2. Vérifiez que l'header 'Authorization: Bearer <token>' est accepté")
-                self.log("   3. Exécutez le script init.ts pour créer les catégories par défaut")
+            for trigger_tests, recommendations in RECOMMENDATIONS:
+                if any(test in failed_tests for test in trigger_tests):
+                    for recommendation in recommendations:
+                        self.log(f"   {recommendation}")
         
         self.log("\n" + "="*50)
         
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests de la gestion des 429 du script de test Budget Tracker contre un serveur factice
+"""
+
+import importlib.util
+import pathlib
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# test.py est chargé par chemin : le nom "test" masquerait le paquet test de la bibliothèque standard
+_spec = importlib.util.spec_from_file_location("budget_tracker_test", pathlib.Path(__file__).with_name("test.py"))
+budget_tracker_test = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(budget_tracker_test)
+
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    """Répond toujours 429 avec un Retry-After long, comme generalLimiter en fin de fenêtre"""
+    retry_after = "900"
+
+    def _reply(self):
+        self.server.request_count += 1
+        body = b'{"error": "Trop de requetes"}'
+        self.send_response(429)
+        self.send_header("Retry-After", self.retry_after)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RateLimitTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedHandler)
+        self.server.request_count = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.tester = budget_tracker_test.BudgetTrackerTester(f"http://127.0.0.1:{self.server.server_port}")
+        self.tester.log = lambda message, level="INFO": None
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tester.session.close()
+
+    def assertGivesUpImmediately(self, call):
+        start = time.monotonic()
+        self.assertIsNone(call())
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_get_with_long_retry_after_returns_immediately(self):
+        self.assertGivesUpImmediately(lambda: self.tester._get("/api/transactions/1/2026"))
+
+    def test_delete_with_long_retry_after_returns_immediately(self):
+        self.assertGivesUpImmediately(lambda: self.tester._delete("/api/transactions/1"))
+
+    def test_post_with_long_retry_after_returns_immediately(self):
+        self.assertGivesUpImmediately(lambda: self.tester._post("/api/transactions", {"amount": 1}))
+
+
+if __name__ == "__main__":
+    unittest.main()